@@ -14,6 +14,7 @@
 
 """Mixin classes for PeekingDuck nodes and models."""
 
+import functools
 import hashlib
 import operator
 import os
@@ -21,7 +22,7 @@ import re
 import sys
 import zipfile
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import requests
 from tqdm import tqdm
@@ -93,15 +94,7 @@ class ThresholdCheckerMixin:
             | (lower, upper)      | lower < config[key] < upper         |
             +---------------------+-------------------------------------+
         """
-        if self.interval_pattern.match(interval) is None:
-            raise ValueError("Badly formatted interval")
-
-        left_bracket = interval[0]
-        right_bracket = interval[-1]
-        lower, upper = [float(value.strip()) for value in interval[1:-1].split(",")]
-
-        if lower > upper:
-            raise ValueError("Lower bound cannot be larger than upper bound")
+        left_bracket, lower, upper, right_bracket = self._parse_interval(interval)
 
         self._check_within_bounds(key, lower, upper, left_bracket, right_bracket)
 
@@ -124,6 +117,37 @@ class ThresholdCheckerMixin:
         if self.config[key] not in choices:
             raise ValueError(f"{key} must be one of {choices}")
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _parse_interval(cls, interval: str) -> Tuple[str, float, float, str]:
+        """Parses the `interval` string into its brackets and bounds. Results
+        are cached as the same few interval strings are checked by every
+        model.
+
+        Args:
+            interval (str): An mathematical interval representing the range of
+                valid values. See `check_bounds` for the syntax.
+
+        Returns:
+            (Tuple[str, float, float, str]): The left bracket, lower bound,
+            upper bound, and right bracket of the interval.
+
+        Raises:
+            ValueError: If `interval` does not match the specified format.
+            ValueError: If the lower bound is larger than the upper bound.
+        """
+        if cls.interval_pattern.match(interval) is None:
+            raise ValueError("Badly formatted interval")
+
+        left_bracket = interval[0]
+        right_bracket = interval[-1]
+        lower, upper = [float(value.strip()) for value in interval[1:-1].split(",")]
+
+        if lower > upper:
+            raise ValueError("Lower bound cannot be larger than upper bound")
+
+        return left_bracket, lower, upper, right_bracket
+
     def _check_within_bounds(  # pylint: disable=too-many-arguments
         self,
         key: Union[str, List[str]],
@@ -16,13 +16,22 @@
 Blurs area bounded by bounding boxes over detected object.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import cv2
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 
+# Fraction of the image covered by bboxes above which blurring the region
+# spanned by all of them once is cheaper than blurring each bbox separately
+UNION_BLUR_THRESHOLD = 0.3
+# Blurred regions start and end on multiples of this many columns, so that
+# OpenCV usually splits their rows into the same SIMD blocks regardless of the
+# region size. Leftover columns are rounded slightly differently by OpenCV.
+# This is best-effort, the block size depends on the OpenCV build and CPU
+BLUR_COLUMN_ALIGNMENT = 16
+
 
 class Node(AbstractNode):  # pylint: disable=too-few-public-methods
     """Blurs area bounded by bounding boxes on image.
@@ -41,7 +50,10 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
     Configs:
         blur_kernel_size (:obj:`int`): **default = 50**. |br|
             This defines the kernel size used in the blur filter. Larger values
-            of ``blur_kernel_size`` gives more intense blurring.
+            of ``blur_kernel_size`` gives more intense blurring. Pixels near
+            the edges of a bounding box are averaged with the pixels just
+            outside of it, within half the kernel size, and overlapping
+            bounding boxes are only blurred once.
     """
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
@@ -53,22 +65,128 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
     def _blur(
         bboxes: List[np.ndarray], image: np.ndarray, blur_kernel_size: int
     ) -> np.ndarray:
-        """Blurs the area bounded by bbox in an image."""
-        height = image.shape[0]
+        """Blurs the area bounded by bbox in an image. Pixels near the edges
+        of a bbox are blurred with their neighbours outside of it, and
+        overlapping areas are only blurred once.
+
+        Args:
+            bboxes (List[np.ndarray]): Normalized bboxes in (x1, y1, x2, y2)
+                format.
+            image (np.ndarray): 8-bit image, modified in place. OpenCV's box
+                filter runs on its SIMD fixed-point path for uint8 input.
+            blur_kernel_size (int): Width and height of the blur kernel.
+
+        Returns:
+            (np.ndarray): Image with the areas bounded by bboxes blurred.
+        """
+        height, width = image.shape[:2]
+        ksize = (blur_kernel_size, blur_kernel_size)
+        # bbox can contain values outside of [0, 1] sometimes, ensures the
+        # ROI selection is within bounds and without wrapping
+        bboxes_px = (
+            np.clip(np.asarray(bboxes, dtype=float).reshape(-1, 4), 0, 1)
+            * [width, height, width, height]
+        ).astype(int)
+        # skip bboxes which bound no pixels, OpenCV cannot blur an empty area
+        bboxes_px = bboxes_px[(bboxes_px[:, 2:] > bboxes_px[:, :2]).all(axis=1)]
+        if len(bboxes_px) == 0:
+            return image
+
+        bbox_sizes = bboxes_px[:, 2:] - bboxes_px[:, :2]
+        if bbox_sizes.prod(axis=1).sum() > UNION_BLUR_THRESHOLD * height * width:
+            return Node._blur_union(bboxes_px, image, ksize)
+        return Node._blur_each(bboxes_px, image, ksize)
+
+    @staticmethod
+    def _pad_bboxes(
+        bboxes_px: np.ndarray, image: np.ndarray, ksize: Tuple[int, int]
+    ) -> np.ndarray:
+        """Pads bboxes so that pixels near their edges see the same
+        neighbourhood as in a blur over the full image, and aligns their
+        columns to `BLUR_COLUMN_ALIGNMENT`.
+
+        Args:
+            bboxes_px (np.ndarray): Bboxes in (x1, y1, x2, y2) pixel
+                coordinates.
+            image (np.ndarray): Image the bboxes are on.
+            ksize (Tuple[int, int]): Width and height of the blur kernel.
+
+        Returns:
+            (np.ndarray): Padded bboxes, clipped to the image.
+        """
+        pad = ksize[0] // 2 + 1
         width = image.shape[1]
+        padded_bboxes = np.concatenate(
+            (
+                np.maximum(bboxes_px[:, :2] - pad, 0),
+                np.minimum(bboxes_px[:, 2:] + pad, image.shape[1::-1]),
+            ),
+            axis=1,
+        )
+        padded_bboxes[:, 0] -= padded_bboxes[:, 0] % BLUR_COLUMN_ALIGNMENT
+        padded_bboxes[:, 2] = np.minimum(
+            -(-padded_bboxes[:, 2] // BLUR_COLUMN_ALIGNMENT) * BLUR_COLUMN_ALIGNMENT,
+            width,
+        )
+        return padded_bboxes
 
-        for bbox in bboxes:
-            x_1, y_1, x_2, y_2 = bbox
-            y_1, y_2 = int(y_1 * height), int(y_2 * height)
-            x_1, x_2 = int(x_1 * width), int(x_2 * width)
+    @staticmethod
+    def _blur_each(
+        bboxes_px: np.ndarray, image: np.ndarray, ksize: Tuple[int, int]
+    ) -> np.ndarray:
+        """Blurs the area bounded by each bbox separately. Gives the same
+        result as `_blur_union` while only blurring the padded bboxes.
 
-            # to get the area bounded by bbox
-            bbox_image = image[y_1:y_2, x_1:x_2, :]
+        Args:
+            bboxes_px (np.ndarray): Non-empty bboxes in (x1, y1, x2, y2)
+                pixel coordinates.
+            image (np.ndarray): 8-bit image, modified in place.
+            ksize (Tuple[int, int]): Width and height of the blur kernel.
 
-            # apply the blur using blur filter from opencv
-            blur_bbox_image = cv2.blur(bbox_image, (blur_kernel_size, blur_kernel_size))
-            image[y_1:y_2, x_1:x_2, :] = blur_bbox_image
+        Returns:
+            (np.ndarray): Image with the areas bounded by bboxes blurred.
+        """
+        padded_bboxes = Node._pad_bboxes(bboxes_px, image, ksize)
+        # blur every bbox before writing any of them back, so overlapping
+        # bboxes are blurred from the original pixels
+        blurred_areas = []
+        for (x_1, y_1, x_2, y_2), (pad_x1, pad_y1, pad_x2, pad_y2) in zip(
+            bboxes_px, padded_bboxes
+        ):
+            blurred = cv2.blur(image[pad_y1:pad_y2, pad_x1:pad_x2, :], ksize)
+            blurred_areas.append(
+                blurred[y_1 - pad_y1 : y_2 - pad_y1, x_1 - pad_x1 : x_2 - pad_x1]
+            )
+        for (x_1, y_1, x_2, y_2), blurred in zip(bboxes_px, blurred_areas):
+            image[y_1:y_2, x_1:x_2, :] = blurred
+        return image
 
+    @staticmethod
+    def _blur_union(
+        bboxes_px: np.ndarray, image: np.ndarray, ksize: Tuple[int, int]
+    ) -> np.ndarray:
+        """Blurs the region spanned by all bboxes once and copies the blurred
+        pixels into the areas bounded by the bboxes. Overlapping areas are
+        only blurred once.
+
+        Args:
+            bboxes_px (np.ndarray): Non-empty bboxes in (x1, y1, x2, y2)
+                pixel coordinates.
+            image (np.ndarray): 8-bit image, modified in place.
+            ksize (Tuple[int, int]): Width and height of the blur kernel.
+
+        Returns:
+            (np.ndarray): Image with the areas bounded by bboxes blurred.
+        """
+        padded_bboxes = Node._pad_bboxes(bboxes_px, image, ksize)
+        x_min, y_min = padded_bboxes[:, :2].min(axis=0)
+        x_max, y_max = padded_bboxes[:, 2:].max(axis=0)
+        region = image[y_min:y_max, x_min:x_max, :]
+        blurred = cv2.blur(region, ksize)
+        # bboxes are rectangles, copy them back as slices instead of through
+        # a mask over the whole region
+        for x_1, y_1, x_2, y_2 in bboxes_px - [x_min, y_min, x_min, y_min]:
+            region[y_1:y_2, x_1:x_2, :] = blurred[y_1:y_2, x_1:x_2, :]
         return image
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
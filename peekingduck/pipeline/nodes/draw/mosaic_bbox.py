@@ -52,6 +52,7 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         super().__init__(config, node_path=__name__, **kwargs)
 
         self.mosaic_level = self.config["mosaic_level"]
+        self._mosaic_size = (self.mosaic_level, self.mosaic_level)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         mosaic_img = self._mosaic_bbox(inputs["img"], inputs["bboxes"])
@@ -69,16 +70,27 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
             (np.ndarray): Image with mosaicked bounding box regions.
         """
         height, width = image.shape[:2]
-        # Prevent calculating mosaic on a mosaicked area
-        original_image = image.copy()
-
-        for bbox in bboxes:
-            # bbox can contain negative values sometimes, ensures the ROI
-            # selection is within bounds and without wrapping
-            rows = slice(int(max(0, bbox[1]) * height), int(min(1, bbox[3]) * height))
-            cols = slice(int(max(0, bbox[0]) * width), int(min(1, bbox[2]) * width))
-
-            image[rows, cols] = self._mosaic(original_image[rows, cols])
+        # bbox can contain negative values sometimes, ensures the ROI
+        # selection is within bounds and without wrapping
+        bboxes_px = (
+            np.clip(np.asarray(bboxes, dtype=float).reshape(-1, 4), 0, 1)
+            * [width, height, width, height]
+        ).astype(int)
+        # Skip bboxes which bound no pixels, they cannot be resized. Skip
+        # copying the image when there is nothing left to mosaic
+        bboxes_px = bboxes_px[(bboxes_px[:, 2:] > bboxes_px[:, :2]).all(axis=1)]
+        if len(bboxes_px) == 0:
+            return image
+        # Prevent calculating mosaic on a mosaicked area, only the region
+        # spanned by the bboxes has to be kept
+        x_min, y_min = bboxes_px[:, :2].min(axis=0)
+        x_max, y_max = bboxes_px[:, 2:].max(axis=0)
+        original_region = image[y_min:y_max, x_min:x_max].copy()
+
+        for x_1, y_1, x_2, y_2 in bboxes_px:
+            image[y_1:y_2, x_1:x_2] = self._mosaic(
+                original_region[y_1 - y_min : y_2 - y_min, x_1 - x_min : x_2 - x_min]
+            )
 
         return image
 
@@ -92,11 +104,7 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
             (np.ndarray): Mosaicked image in numpy array.
         """
         height, width = image.shape[:2]
-        image = cv2.resize(
-            image,
-            (self.mosaic_level, self.mosaic_level),
-            interpolation=cv2.INTER_LANCZOS4,
-        )
+        image = cv2.resize(image, self._mosaic_size, interpolation=cv2.INTER_LANCZOS4)
         image = cv2.resize(image, (width, height), interpolation=cv2.INTER_NEAREST)
 
         return image
@@ -126,12 +126,9 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         scores = scores.numpy()[0]
         scores = scores[:num_valid]
 
-        bboxes = bboxes.numpy()[0]
-        bboxes = bboxes[:num_valid]
-
         # swapping x and y axes
-        bboxes[:, [0, 1]] = bboxes[:, [1, 0]]
-        bboxes[:, [2, 3]] = bboxes[:, [3, 2]]
+        bboxes = bboxes.numpy()[0]
+        bboxes = bboxes[:num_valid, [1, 0, 3, 2]]
 
         # scaling of bboxes if v4tiny model is used
         if self.model_type == "v4tiny":
@@ -140,10 +137,11 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         return bboxes, scores, classes
 
     def _preprocess(self, image: np.ndarray) -> np.ndarray:
-        image = cv2.resize(image, self.input_size)
-        image = np.asarray([image]).astype(np.float32) / 255.0
+        # Convert to float32 once and normalize in place on the resized image
+        image = cv2.resize(image, self.input_size).astype(np.float32)
+        image /= 255.0
 
-        return image
+        return image[np.newaxis]
 
     @staticmethod
     def scale_bboxes(bboxes: np.ndarray, scale_factor: float) -> np.ndarray:
@@ -153,11 +151,6 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         Darknet repo) to tf model, bboxes are bigger. So downscaling is
         required for a better fit.
         """
-        outputs = np.empty_like(bboxes)
-        center_x = (bboxes[:, 0] + bboxes[:, 2]) / 2
-        center_y = (bboxes[:, 1] + bboxes[:, 3]) / 2
-        outputs[:, 0] = center_x - (bboxes[:, 2] - bboxes[:, 0]) / 2 * scale_factor
-        outputs[:, 1] = center_y - (bboxes[:, 3] - bboxes[:, 1]) / 2 * scale_factor
-        outputs[:, 2] = center_x + (bboxes[:, 2] - bboxes[:, 0]) / 2 * scale_factor
-        outputs[:, 3] = center_y + (bboxes[:, 3] - bboxes[:, 1]) / 2 * scale_factor
-        return outputs
+        centers = (bboxes[:, :2] + bboxes[:, 2:]) / 2
+        half_sizes = (bboxes[:, 2:] - bboxes[:, :2]) / 2 * scale_factor
+        return np.concatenate((centers - half_sizes, centers + half_sizes), axis=1)
@@ -44,7 +44,7 @@ class Node(AbstractNode):
             **default = "PeekingDuck/data/stats.csv"**. |br|
             Path of the CSV file to be saved. The resulting file name would have an appended
             timestamp.
-        logging_interval (:obj:`int`): **default = 1**. |br|
+        logging_interval (:obj:`float`): **default = 1**. |br|
             Interval between each log, in terms of seconds.
     """
 
@@ -52,7 +52,7 @@ class Node(AbstractNode):
         super().__init__(config, node_path=__name__, **kwargs)
 
         self.logger = logging.getLogger(__name__)
-        self.logging_interval = int(self.logging_interval)  # type: ignore
+        self.logging_interval = float(self.logging_interval)  # type: ignore
         self.file_path = Path(self.file_path)  # type: ignore
         # check if file_path has a '.csv' extension
         if self.file_path.suffix != ".csv":
@@ -83,6 +83,7 @@ class Node(AbstractNode):
         if not self._stats_checked:
             self._check_tracked_stats(inputs)
             # self._stats_to_track might change after the check
+            self.csv_logger.close()
             self.csv_logger = CSVLogger(
                 self._file_path_datetime, self.stats_to_track, self.logging_interval
             )
@@ -120,7 +121,7 @@ class Node(AbstractNode):
         self._stats_checked = True
 
     def _reset(self) -> None:
-        del self.csv_logger
+        self.csv_logger.close()
 
         # initialize for use in run
         self._stats_checked = False
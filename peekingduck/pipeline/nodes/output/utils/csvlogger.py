@@ -16,25 +16,100 @@
 Utils for CSV logging
 """
 
+import atexit
 import csv
-from datetime import datetime
+import io
+import os
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 
-class CSVLogger:
-    """Node that writes data into a csv"""
+class CSVLogger:  # pylint: disable=too-many-instance-attributes
+    """Node that writes data into a csv. Rows are formatted on the calling
+    thread, the file is written by a background thread.
 
-    def __init__(
-        self, file_path: Path, headers: List[str], logging_interval: int = 1
+    Args:
+        file_path (Path): Path of the CSV file, rows are appended to it.
+        headers (List[str]): Names of the tracked data, written after the
+            "Time" column.
+        logging_interval (float): Minimum number of seconds between rows.
+        flush_every (Optional[int]): Write the in-memory rows to the file
+            after every `flush_every` rows to bound data loss if the process
+            crashes. When None, rows are only written every `batch_size` rows
+            or when the file is closed.
+        batch_size (int): Number of rows formatted in memory before they are
+            handed to the writer thread in a single write.
+        fast_mode (bool): Join values with commas directly instead of going
+            through the csv module. Only valid when no value contains commas,
+            quotes, or line breaks once converted with str().
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        file_path: Path,
+        headers: List[str],
+        logging_interval: float = 1,
+        *,
+        flush_every: Optional[int] = None,
+        batch_size: int = 16,
+        fast_mode: bool = False,
     ) -> None:
-        self.headers = headers.copy()
-        self.headers.insert(0, "Time")
+        self.headers = ("Time", *headers)
         self.file_path = file_path
-        self.logging_interval = logging_interval
-        self.csv_file = open(self.file_path, mode="a+", newline="")
-        self.writer = csv.DictWriter(self.csv_file, fieldnames=self.headers)
-        self.last_write = datetime.now()
+        self.logging_interval = float(logging_interval)
+        # the in-memory batch is the only buffer, encoded batches go straight
+        # to the file descriptor. O_APPEND makes each write land at the end of
+        # the file, O_BINARY stops Windows from turning the csv module's
+        # "\r\n" line endings into "\r\r\n"
+        self._fd = os.open(
+            self.file_path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self.closed = False
+        self.flush_every = flush_every
+        self._unflushed_rows = 0
+        self.batch_size = batch_size
+        self._batched_rows = 0
+        self._write_header = os.fstat(self._fd).st_size == 0
+        # rows are formatted into an in-memory buffer which is written to the
+        # file once every `batch_size` rows
+        self._batch = io.StringIO()
+        self.writer = csv.writer(self._batch)
+        # bound once as they are used for every row
+        self._write_to_batch = self._batch.write
+        self._line_terminator = self.writer.dialect.lineterminator
+        # rows with known-safe values skip the csv module's quoting checks
+        self._write_row = self._write_plain_row if fast_mode else self.writer.writerow
+        self._write_rows = (
+            self._write_plain_rows if fast_mode else self.writer.writerows
+        )
+        # column position of each header, rows are written as plain lists
+        self._header_index = {header: i for i, header in enumerate(self.headers)}
+        # monotonic clock for the interval check, it is not affected by
+        # system clock changes
+        self.last_write = time.monotonic()
+        # formatted "Time" column, reused for rows within the same second
+        self._last_second = -1
+        self._last_time_str = ""
+        # file I/O happens on a background thread so it does not stall the
+        # pipeline, the bounded queue limits how many batches can pile up
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=64)
+        # error raised while writing to the file, re-raised to the caller
+        self._write_error: Optional[Exception] = None
+        self._writer_thread = threading.Thread(target=self._write_worker, daemon=True)
+        self._writer_thread.start()
+        # make sure buffered rows reach the file even if close() is never called
+        atexit.register(self.close)
+
+    def __enter__(self) -> "CSVLogger":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
 
     def write(self, data_pool: Dict[str, Any], specific_data: List[str]) -> None:
         """
@@ -47,18 +122,168 @@ class CSVLogger:
         Returns:
             None
         """
-        # if file is empty write header
-        if self.csv_file.tell() == 0:
-            self.writer.writeheader()
+        self._raise_write_error()
+        self._write_header_if_new()
+
+        curr_time = time.monotonic()
+        # only build the row and format its timestamp when it will be written
+        if curr_time - self.last_write < self.logging_interval:
+            return
+
+        # look up only the tracked keys instead of scanning the whole data pool,
+        # columns without data are left empty
+        header_index = self._header_index
+        row = [""] * len(self.headers)
+        row[0] = self._time_str()
+        for key in specific_data:
+            if key in data_pool:
+                row[header_index[key]] = data_pool[key]
+
+        self._write_row(row)
+        self.last_write = curr_time
+        self._count_rows(1)
+
+    def write_many(self, batch: Dict[str, Sequence[Any]]) -> None:
+        """
+        Writes multiple rows of data in a csv file, all sharing the same
+        timestamp. The logging interval applies to the batch as a whole.
+
+        Args:
+            batch(dict): columns of data keyed by header, e.g. numpy arrays
+                of per-detection values. All columns must have the same
+                length, headers missing from `batch` are left empty.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: The columns in `batch` have different lengths.
+        """
+        self._raise_write_error()
+        self._write_header_if_new()
+        tracked = [header for header in self.headers[1:] if header in batch]
+        if not tracked:
+            return
+
+        column_lengths = {header: len(batch[header]) for header in tracked}
+        num_rows = column_lengths[tracked[0]]
+        # zip() would silently drop the rows beyond the shortest column
+        if any(length != num_rows for length in column_lengths.values()):
+            raise ValueError(f"All columns must have the same length: {column_lengths}")
+
+        curr_time = time.monotonic()
+        if curr_time - self.last_write < self.logging_interval:
+            return
+
+        empty_column = [""] * num_rows
+        columns = [batch.get(header, empty_column) for header in self.headers[1:]]
+        # the csv module formats all rows in a single call
+        self._write_rows(zip([self._time_str()] * num_rows, *columns))
+        self.last_write = curr_time
+        self._count_rows(num_rows)
+
+    def _write_header_if_new(self) -> None:
+        """Writes the header row if the file was empty when it was opened."""
+        if self._write_header:
+            self._write_row(self.headers)
+            self._write_header = False
+
+    def _count_rows(self, num_rows: int) -> None:
+        """Writes the in-memory rows to the file every `batch_size` rows, and
+        flushes the file every `flush_every` rows.
+        """
+        self._batched_rows += num_rows
+        if self._batched_rows >= self.batch_size:
+            self._write_batch()
 
-        content = {k: v for k, v in data_pool.items() if k in specific_data}
-        curr_time = datetime.now()
-        time_str = curr_time.strftime("%H:%M:%S")
-        content.update({"Time": time_str})
+        if self.flush_every is not None:
+            self._unflushed_rows += num_rows
+            if self._unflushed_rows >= self.flush_every:
+                self._write_batch()
+                self._unflushed_rows = 0
 
-        if (curr_time - self.last_write).seconds >= self.logging_interval:
-            self.writer.writerow(content)
-            self.last_write = curr_time
+    def _write_plain_row(self, row: Sequence[Any]) -> None:
+        """Writes `row` as comma-joined str() values, using the same line
+        terminator as the csv module.
+        """
+        self._write_to_batch(",".join(map(str, row)) + self._line_terminator)
 
-    def __del__(self) -> None:
-        self.csv_file.close()
+    def _write_plain_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Writes `rows` as comma-joined str() values in a single call."""
+        line_terminator = self._line_terminator
+        self._write_to_batch(
+            "".join(",".join(map(str, row)) + line_terminator for row in rows)
+        )
+
+    def _write_batch(self) -> None:
+        """Hands the rows formatted in memory to the writer thread and empties
+        the in-memory buffer.
+        """
+        self._raise_write_error()
+        text = self._batch.getvalue()
+        self._batch.seek(0)
+        self._batch.truncate()
+        self._batched_rows = 0
+        if text:
+            self._queue.put(text)
+
+    def _write_worker(self) -> None:
+        """Writes queued batches to the file until None is queued. After a
+        failed write, the error is stored and later batches are discarded so
+        that the queue never fills up.
+        """
+        while True:
+            text = self._queue.get()
+            try:
+                if text is None:
+                    return
+                if self._write_error is None:
+                    data = memoryview(text.encode("utf-8"))
+                    # os.write() may write fewer bytes than requested
+                    while data:
+                        data = data[os.write(self._fd, data) :]
+            except Exception as error:  # pylint: disable=broad-except
+                self._write_error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_write_error(self) -> None:
+        """Re-raises the error which stopped the writer thread from writing
+        to the file.
+        """
+        if self._write_error is not None:
+            raise self._write_error
+
+    def _time_str(self) -> str:
+        """Returns the current wall clock time as "%H:%M:%S", only formatting
+        it once per second.
+        """
+        second = int(time.time())
+        if second != self._last_second:
+            self._last_time_str = time.strftime("%H:%M:%S", time.localtime(second))
+            self._last_second = second
+        return self._last_time_str
+
+    def flush(self) -> None:
+        """Hands the rows formatted in memory to the writer thread and waits
+        until it has written all of them to the file.
+        """
+        self._write_batch()
+        self._queue.join()
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """Writes the remaining rows and closes the csv file. Does nothing if
+        the file is already closed.
+        """
+        if self.closed:
+            return
+        atexit.unregister(self.close)
+        try:
+            self._write_batch()
+        finally:
+            self._queue.put(None)
+            self._writer_thread.join()
+            os.close(self._fd)
+            self.closed = True
+        self._raise_write_error()
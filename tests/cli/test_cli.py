@@ -30,7 +30,7 @@ from click.testing import CliRunner
 from peekingduck import __version__
 from peekingduck.cli import cli
 from peekingduck.declarative_loader import PEEKINGDUCK_NODE_TYPES
-from tests.conftest import assert_msg_in_logs
+from tests.conftest import YAML_DUMPER, assert_msg_in_logs
 
 UNIQUE_SUFFIX = "".join(random.choice(string.ascii_lowercase) for _ in range(8))
 CUSTOM_FOLDER_NAME = f"custom_nodes_{UNIQUE_SUFFIX}"
@@ -100,7 +100,7 @@ def available_nodes_msg(type_name=None):
 
 def create_node_config(config_dir, node_name, config_text):
     with open(config_dir / f"{node_name}.yml", "w") as outfile:
-        yaml.dump(config_text, outfile)
+        yaml.dump(config_text, outfile, Dumper=YAML_DUMPER)
 
 
 def create_node_python(node_dir, node_name, return_statement):
@@ -124,7 +124,7 @@ def create_pipeline_yaml(nodes, custom_config_path):
     with open(
         CUSTOM_PIPELINE_PATH if custom_config_path else PIPELINE_PATH, "w"
     ) as outfile:
-        yaml.dump(nodes, outfile, default_flow_style=False)
+        yaml.dump(nodes, outfile, Dumper=YAML_DUMPER, default_flow_style=False)
 
 
 def get_custom_node_subpaths(node_subdir, node_type, node_name):
@@ -303,7 +303,7 @@ class TestCli:
         # test_config_path = tmp_dir / "test_config.yml"
         test_config_path = "test_config.yml"
         with open(test_config_path, "w") as outfile:
-            yaml.dump(nodes, outfile, default_flow_style=False)
+            yaml.dump(nodes, outfile, Dumper=YAML_DUMPER, default_flow_style=False)
 
         # run unit test
         cmd = [
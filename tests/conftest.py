@@ -45,6 +45,9 @@ PKD_DIR = Path(__file__).resolve().parents[1] / "peekingduck"
 TEST_DATA_DIR = PKD_DIR.parent / "tests" / "data"
 TEST_IMAGES_DIR = TEST_DATA_DIR / "images"
 
+# libyaml's C dumper when available, same output as the pure Python one
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @pytest.fixture
 def create_image():
@@ -25,18 +25,16 @@ import pytest
 from peekingduck.pipeline.nodes.draw.bbox import Node
 
 BLACK_IMAGE = ["black.jpg"]
-# path to reach 4 file levels up from test_bbox.py
-PKD_DIR = Path(__file__).resolve().parents[3]
+# tests/data/images, 4 file levels up from test_bbox.py
+TEST_IMG_DIR = Path(__file__).resolve().parents[3] / "data" / "images"
 
 
-@pytest.fixture(params=BLACK_IMAGE)
+@pytest.fixture(scope="session", params=BLACK_IMAGE)
 def black_image(request):
-    test_img_dir = PKD_DIR.parent / "tests" / "data" / "images"
+    yield cv2.imread(str(TEST_IMG_DIR / request.param))
 
-    yield test_img_dir / request.param
 
-
-@pytest.fixture
+@pytest.fixture(scope="class")
 def draw_bbox_no_labels():
     node = Node(
         {
@@ -48,7 +46,7 @@ def draw_bbox_no_labels():
     return node
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def draw_bbox_show_labels():
     node = Node(
         {
@@ -74,7 +72,7 @@ class TestBbox:
         self, draw_bbox_no_labels, draw_bbox_show_labels, black_image
     ):
         bboxes = [np.array([0, 0, 1, 1])]
-        original_img = cv2.imread(str(black_image))
+        original_img = black_image.copy()
         output_img_no_label = original_img.copy()
         output_img_show_label = original_img.copy()
         labels = ["Person"]
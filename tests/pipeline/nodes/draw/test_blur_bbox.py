@@ -120,3 +120,114 @@ class TestBlur:
                 original_bbox_bounded_area,
                 output_bbox_bounded_area,
             )
+
+    def test_out_of_bounds_bbox(self, draw_blur_node, test_image):
+        original_img = cv2.imread(str(test_image))
+        frame_height = original_img.shape[0]
+        frame_width = original_img.shape[1]
+        x2, y2 = int(0.2 * frame_width), int(0.2 * frame_height)
+        original_bbox_bounded_area = original_img[:y2, :x2, :]
+
+        output_img = original_img.copy()
+        input = {
+            # x1,y1,x2,y2
+            "bboxes": [np.asarray([-0.1, -0.1, 0.2, 0.2])],
+            "img": output_img,
+            "bbox_labels": ["LP"],
+        }
+
+        draw_blur_node.run(input)
+        output_bbox_bounded_area = output_img[:y2, :x2, :]
+
+        # negative coordinates are clipped to the image boundary instead of
+        # wrapping around, so the area within the image is still blurred
+        np.testing.assert_raises(
+            AssertionError,
+            np.testing.assert_array_equal,
+            original_bbox_bounded_area,
+            output_bbox_bounded_area,
+        )
+
+    def test_large_bbox(self, draw_blur_node, test_image):
+        original_img = cv2.imread(str(test_image))
+        frame_height = original_img.shape[0]
+        frame_width = original_img.shape[1]
+        x2, y2 = int(0.8 * frame_width), int(0.8 * frame_height)
+
+        output_img = original_img.copy()
+        input = {
+            # x1,y1,x2,y2
+            "bboxes": [
+                np.asarray([0.0, 0.0, 0.8, 0.8]),
+                np.asarray([0.2, 0.2, 0.6, 0.6]),
+            ],
+            "img": output_img,
+            "bbox_labels": ["LP"],
+        }
+
+        draw_blur_node.run(input)
+
+        # bboxes cover most of the image so the blurred area is composited
+        # from a single blur over the region spanned by the bboxes
+        np.testing.assert_raises(
+            AssertionError,
+            np.testing.assert_array_equal,
+            original_img[:y2, :x2, :],
+            output_img[:y2, :x2, :],
+        )
+        np.testing.assert_equal(original_img[y2:, :, :], output_img[y2:, :, :])
+        np.testing.assert_equal(original_img[:, x2:, :], output_img[:, x2:, :])
+
+    def test_sparse_and_dense_bbox_blur_match(self, test_image):
+        # kernel size where OpenCV may round the rightmost columns differently
+        # depending on the width of the blurred region
+        draw_blur_node = Node(
+            {
+                "input": ["bboxes", "img", "bbox_labels"],
+                "output": ["img"],
+                "blur_kernel_size": 28,
+            }
+        )
+        original_img = cv2.imread(str(test_image))
+        frame_height = original_img.shape[0]
+        frame_width = original_img.shape[1]
+        x1 = int(0.4 * frame_width)
+        y1, y2 = int(0.5 * frame_height), int(0.9 * frame_height)
+        # overlapping bboxes covering a small part of the image, one of them
+        # touching its right edge
+        bboxes = [np.asarray([0.4, 0.6, 0.6, 0.7]), np.asarray([0.55, 0.5, 1.0, 0.9])]
+
+        sparse_img = original_img.copy()
+        draw_blur_node.run({"bboxes": bboxes, "img": sparse_img, "bbox_labels": []})
+        dense_img = original_img.copy()
+        # an unrelated large bbox switches to blurring the bboxes together
+        draw_blur_node.run(
+            {
+                "bboxes": bboxes + [np.asarray([0.0, 0.0, 0.6, 0.45])],
+                "img": dense_img,
+                "bbox_labels": [],
+            }
+        )
+
+        # the column alignment only makes both paths bit-identical on a
+        # best-effort basis, OpenCV builds may still differ by one level
+        np.testing.assert_allclose(
+            sparse_img[y1:y2, x1:], dense_img[y1:y2, x1:], rtol=0, atol=1
+        )
+
+    def test_zero_area_bbox(self, draw_blur_node, test_image):
+        original_img = cv2.imread(str(test_image))
+        output_img = original_img.copy()
+
+        input = {
+            # x1,y1,x2,y2
+            "bboxes": [
+                np.asarray([0.4, 0.6, 0.4, 0.7]),
+                np.asarray([1.1, 0.1, 1.2, 0.2]),
+            ],
+            "img": output_img,
+            "bbox_labels": ["LP", "LP"],
+        }
+
+        draw_blur_node.run(input)
+        np.testing.assert_equal(original_img, output_img)
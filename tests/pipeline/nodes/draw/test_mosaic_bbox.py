@@ -112,3 +112,19 @@ class TestMosaic:
                 original_bbox_bounded_area,
                 output_bbox_bounded_area,
             )
+
+    def test_zero_area_bbox(self, draw_mosaic_node, test_image):
+        original_img = cv2.imread(str(test_image))
+        output_img = original_img.copy()
+
+        input = {
+            # x1,y1,x2,y2
+            "bboxes": [
+                np.asarray([0.4, 0.6, 0.4, 0.7]),
+                np.asarray([1.1, 0.1, 1.2, 0.2]),
+            ],
+            "img": output_img,
+        }
+
+        draw_mosaic_node.run(input)
+        np.testing.assert_equal(original_img, output_img)
@@ -15,11 +15,15 @@
 import csv
 import datetime
 import re
+import time
 from pathlib import Path
+from unittest import mock
 
+import numpy as np
 import pytest
 
 from peekingduck.pipeline.nodes.output.csv_writer import Node
+from peekingduck.pipeline.nodes.output.utils.csvlogger import CSVLogger
 
 
 def directory_contents():
@@ -154,3 +158,153 @@ class TestCSVWriter:
                 pass
 
         assert header == ["Time", "bbox"]
+
+
+def read_rows_when_written(file_path, num_rows, timeout=5):
+    """Reads the csv rows once the writer thread has written `num_rows` of
+    them, without handing over the rows CSVLogger still holds in memory.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        with open(file_path, newline="") as csvfile:
+            rows = list(csv.reader(csvfile))
+        if len(rows) >= num_rows or time.monotonic() > deadline:
+            return rows
+        time.sleep(0.01)
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestCSVLogger:
+    def test_flush_every(self):
+        file_path = Path.cwd() / "test3.csv"
+        logger = CSVLogger(file_path, ["bbox"], logging_interval=0, flush_every=2)
+        inputs = {"bbox": [[1, 2, 3, 4]]}
+
+        logger.write(inputs, ["bbox"])
+        # header and first row are still buffered
+        assert file_path.read_text() == ""
+
+        logger.write(inputs, ["bbox"])
+        rows = read_rows_when_written(file_path, 3)
+
+        assert rows[0] == ["Time", "bbox"]
+        assert len(rows) == 3
+        logger.close()
+
+    def test_close(self):
+        file_path = Path.cwd() / "test4.csv"
+        with CSVLogger(file_path, ["bbox"], logging_interval=0) as logger:
+            logger.write({"bbox": [[1, 2, 3, 4]]}, ["bbox"])
+
+        assert logger.closed
+        with open(file_path, newline="") as csvfile:
+            rows = list(csv.reader(csvfile))
+
+        assert rows[0] == ["Time", "bbox"]
+        assert len(rows) == 2
+        # rows end with the csv module's line terminator on every platform
+        assert file_path.read_bytes().count(b"\r\n") == 2
+        assert b"\r\r\n" not in file_path.read_bytes()
+        # closing again is a no-op
+        logger.close()
+
+    def test_fast_mode(self):
+        file_path = Path.cwd() / "test5.csv"
+        with CSVLogger(
+            file_path, ["count", "label"], logging_interval=0, fast_mode=True
+        ) as logger:
+            logger.write({"count": 3, "label": "person"}, ["count", "label"])
+            logger.write({"count": 4}, ["count", "label"])
+
+        with open(file_path, newline="") as csvfile:
+            rows = list(csv.reader(csvfile))
+
+        assert rows[0] == ["Time", "count", "label"]
+        assert rows[1][1:] == ["3", "person"]
+        assert rows[2][1:] == ["4", ""]
+
+    def test_batch_size(self):
+        file_path = Path.cwd() / "test6.csv"
+        logger = CSVLogger(file_path, ["bbox"], logging_interval=0, batch_size=3)
+        inputs = {"bbox": [[1, 2, 3, 4]]}
+
+        for _ in range(2):
+            logger.write(inputs, ["bbox"])
+        assert file_path.read_text() == ""
+
+        logger.write(inputs, ["bbox"])
+        rows = read_rows_when_written(file_path, 4)
+
+        assert rows[0] == ["Time", "bbox"]
+        assert len(rows) == 4
+        logger.close()
+
+    def test_flush(self):
+        file_path = Path.cwd() / "test10.csv"
+        logger = CSVLogger(file_path, ["bbox"], logging_interval=0)
+        inputs = {"bbox": [[1, 2, 3, 4]]}
+
+        # fewer rows than batch_size are still held in memory
+        for _ in range(3):
+            logger.write(inputs, ["bbox"])
+        assert file_path.read_text() == ""
+
+        logger.flush()
+        with open(file_path, newline="") as csvfile:
+            rows = list(csv.reader(csvfile))
+
+        assert rows[0] == ["Time", "bbox"]
+        assert len(rows) == 4
+        logger.close()
+
+    @pytest.mark.parametrize("fast_mode", [False, True])
+    def test_write_many(self, fast_mode):
+        file_path = Path.cwd() / "test7.csv"
+        with CSVLogger(
+            file_path, ["label", "score"], logging_interval=0, fast_mode=fast_mode
+        ) as logger:
+            logger.write_many(
+                {"label": np.array(["person", "car"]), "score": np.array([1, 2])}
+            )
+            logger.write_many({"score": np.array([3])})
+
+        with open(file_path, newline="") as csvfile:
+            rows = list(csv.reader(csvfile))
+
+        assert rows[0] == ["Time", "label", "score"]
+        assert [row[1:] for row in rows[1:]] == [
+            ["person", "1"],
+            ["car", "2"],
+            ["", "3"],
+        ]
+        # rows from the same batch share a timestamp
+        assert rows[1][0] == rows[2][0]
+
+    def test_write_many_different_lengths(self):
+        file_path = Path.cwd() / "test9.csv"
+        with CSVLogger(file_path, ["a", "b"], logging_interval=0) as logger:
+            with pytest.raises(ValueError, match="same length"):
+                logger.write_many({"a": [1, 2, 3], "b": [9]})
+
+        with open(file_path, newline="") as csvfile:
+            rows = list(csv.reader(csvfile))
+
+        # only the header is written
+        assert rows == [["Time", "a", "b"]]
+
+    def test_write_error(self):
+        file_path = Path.cwd() / "test8.csv"
+        logger = CSVLogger(file_path, ["bbox"], logging_interval=0, batch_size=1)
+        inputs = {"bbox": [[1, 2, 3, 4]]}
+
+        with mock.patch("os.write", side_effect=OSError("disk full")):
+            logger.write(inputs, ["bbox"])
+            with pytest.raises(OSError, match="disk full"):
+                logger.flush()
+            # rows are not queued for the failed writer thread
+            with pytest.raises(OSError, match="disk full"):
+                logger.write(inputs, ["bbox"])
+            with pytest.raises(OSError, match="disk full"):
+                logger.close()
+
+        assert logger.closed
@@ -22,6 +22,7 @@ import yaml
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 from peekingduck.runner import Runner
 from peekingduck.utils.requirement_checker import RequirementChecker
+from tests.conftest import YAML_DUMPER
 
 PKD_NODE_TYPE = "pkd_node_type"
 PKD_NODE_NAME = "pkd_node_name"
@@ -29,6 +30,8 @@ PKD_NODE_NAME_2 = "pkd_node_name2"
 PKD_NODE = f"{PKD_NODE_TYPE}.{PKD_NODE_NAME}"
 PKD_NODE_2 = f"{PKD_NODE_TYPE}.{PKD_NODE_NAME_2}"
 NODES = {"nodes": [PKD_NODE, PKD_NODE_2]}
+# serialized once, every test writes it into its own tmp_dir
+NODES_YAML = yaml.dump(NODES, Dumper=YAML_DUMPER, default_flow_style=False)
 
 MODULE_DIR = Path("tmp_dir")
 PIPELINE_PATH = MODULE_DIR / "pipeline_config.yml"
@@ -53,18 +56,15 @@ class MockedNode(AbstractNode):
 def create_node_config(config_dir, node_name):
     config_text = {"root": None, "input": ["none"], "output": ["pipeline_end"]}
     with open(config_dir / f"{node_name}.yml", "w") as fp:
-        yaml.dump(config_text, fp)
-
-
-def create_pipeline_yaml(nodes):
-    with open(PIPELINE_PATH, "w") as outfile:
-        yaml.dump(nodes, outfile, default_flow_style=False)
+        yaml.dump(config_text, fp, Dumper=YAML_DUMPER)
 
 
 def setup():
-    sys.path.append(str(Path.cwd() / MODULE_DIR))
-    PKD_NODE_DIR.mkdir(parents=True)
-    create_pipeline_yaml(NODES)
+    module_path = str(Path.cwd() / MODULE_DIR)
+    if module_path not in sys.path:
+        sys.path.append(module_path)
+    PKD_NODE_DIR.mkdir(parents=True, exist_ok=True)
+    PIPELINE_PATH.write_text(NODES_YAML)
 
 
 def get_pipeline_with_default_node_names():